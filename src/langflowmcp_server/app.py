@@ -5,12 +5,13 @@ import sys
 from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator, Dict, Optional
 
-import anyio
 import dotenv
+import httpx
+import pydantic_core
 from fastmcp import FastMCP
 from pydantic import ValidationError
 
-from .langflow_api_client import LangflowApiClient, LangflowApiException, LangflowAuthException
+from .langflow_api_client import LangflowApiClient, LangflowApiException, LangflowAuthException, create_shared_httpx_client
 from .langflow_models import LangflowClientCreds
 
 # --- Environment & Logging Setup ---
@@ -31,84 +32,124 @@ logging.basicConfig(
 logger = logging.getLogger("langflowmcp_server.app")
 
 # --- Session Management ---
-active_langflow_api_clients: Dict[str, LangflowApiClient] = {}
-_client_creation_locks: Dict[str, asyncio.Lock] = {}
-_global_lock = asyncio.Lock()
+_client_creation_locks: Dict[int, asyncio.Lock] = {}
+_SESSION_CLIENT_ATTR = "_langflow_client"
 
-async def _get_lock(session_id: str) -> asyncio.Lock:
-    async with _global_lock:
-        return _client_creation_locks.setdefault(session_id, asyncio.Lock())
+# All sessions share one pooled transport; each LangflowApiClient only carries its own credentials.
+_shared_httpx_client: Optional[httpx.AsyncClient] = None
+# The lifespan runs once per connection on SSE / streamable HTTP, so the shared transport and
+# creation-lock map are only torn down when the last active lifespan exits.
+_active_lifespans = 0
+
+def _get_shared_httpx_client() -> httpx.AsyncClient:
+    global _shared_httpx_client
+    if _shared_httpx_client is None or _shared_httpx_client.is_closed:
+        _shared_httpx_client = create_shared_httpx_client()
+    return _shared_httpx_client
 
 async def get_session_langflow_client(ctx: Any) -> LangflowApiClient:
     session_object = getattr(ctx, 'session', None)
     if not session_object:
         raise LangflowApiException(0, "Server error: Could not access session object from context.")
-    session_id = str(id(session_object))
 
-    if session_id in active_langflow_api_clients:
-        return active_langflow_api_clients[session_id]
+    # Fast path: the client is cached on the session object itself, so a hit is a single attribute load.
+    cached_client = getattr(session_object, _SESSION_CLIENT_ATTR, None)
+    if cached_client is not None:
+        return cached_client
 
-    creation_lock = await _get_lock(session_id)
-    async with creation_lock:
-        if session_id in active_langflow_api_clients:
-            return active_langflow_api_clients[session_id]
+    session_id = id(session_object)
+    # dict.setdefault is atomic, so no global lock is needed to hand out per-session locks.
+    creation_lock = _client_creation_locks.setdefault(session_id, asyncio.Lock())
+    try:
+        async with creation_lock:
+            cached_client = getattr(session_object, _SESSION_CLIENT_ATTR, None)
+            if cached_client is not None:
+                return cached_client
 
-        logger.info(f"Creating new LangflowApiClient for session {session_id}.")
+            logger.info(f"Creating new LangflowApiClient for session {session_id}.")
         
-        initialize_params = getattr(session_object, '_client_params', None)
-        raw_meta = getattr(initialize_params, '_meta', None) if initialize_params else None
+            initialize_params = getattr(session_object, '_client_params', None)
+            raw_meta = getattr(initialize_params, '_meta', None) if initialize_params else None
         
-        creds_dict: Optional[Dict[str, Any]] = None
-        creds_source = "environment"
-
-        if isinstance(raw_meta, dict) and "langflow_credentials" in raw_meta:
-            creds_dict = raw_meta["langflow_credentials"]
-            creds_source = "_meta.langflow_credentials"
-        else:
-            api_key = os.getenv("LANGFLOW_API_KEY")
-            if api_key:
-                creds_dict = {"api_key": api_key}
-
-        if not creds_dict:
-            raise LangflowAuthException("Langflow API key not supplied via _meta or env vars (LANGFLOW_API_KEY).")
-
-        base_url = creds_dict.get("url") or os.getenv("LANGFLOW_BASE_URL")
-        if not base_url:
-            raise LangflowApiException(0, "LANGFLOW_BASE_URL not configured on server or provided in _meta.")
-
-        try:
-            creds = LangflowClientCreds.model_validate(creds_dict)
-            api_client = await LangflowApiClient.create(base_url=base_url, api_key=creds.api_key)
-            active_langflow_api_clients[session_id] = api_client
-            logger.info(f"LangflowApiClient created successfully for session {session_id} using credentials from {creds_source}.")
-            return api_client
-        except ValidationError as e:
-            raise LangflowAuthException(f"Invalid Langflow credentials structure: {e}")
-        except (LangflowAuthException, LangflowApiException) as e:
-            logger.error(f"Failed to create LangflowApiClient for session {session_id}: {e}")
-            async with _global_lock:
-                _client_creation_locks.pop(session_id, None)
-            raise
+            creds_dict: Optional[Dict[str, Any]] = None
+            creds_source = "environment"
+
+            if isinstance(raw_meta, dict) and "langflow_credentials" in raw_meta:
+                creds_dict = raw_meta["langflow_credentials"]
+                creds_source = "_meta.langflow_credentials"
+            else:
+                api_key = os.getenv("LANGFLOW_API_KEY")
+                if api_key:
+                    creds_dict = {"api_key": api_key}
+
+            if not creds_dict:
+                raise LangflowAuthException("Langflow API key not supplied via _meta or env vars (LANGFLOW_API_KEY).")
+
+            try:
+                if creds_source == "environment":
+                    # Server-side env credentials are trusted; skip validation.
+                    creds = LangflowClientCreds.model_construct(api_key=creds_dict["api_key"], url=None)
+                else:
+                    creds = LangflowClientCreds.model_validate(creds_dict)
+
+                base_url = creds.url or os.getenv("LANGFLOW_BASE_URL")
+                if not base_url:
+                    raise LangflowApiException(0, "LANGFLOW_BASE_URL not configured on server or provided in _meta.")
+                try:
+                    scheme = httpx.URL(base_url).scheme
+                except httpx.InvalidURL:
+                    scheme = ""
+                if scheme not in ("http", "https"):
+                    raise LangflowApiException(0, f"Invalid Langflow base URL '{base_url}': expected an http(s) URL.")
+
+                api_client = await LangflowApiClient.create(
+                    base_url=base_url, api_key=creds.api_key, get_httpx_client=_get_shared_httpx_client
+                )
+                # Publish via setdefault on the session itself: if a racing creator got there first, its client wins.
+                api_client = session_object.__dict__.setdefault(_SESSION_CLIENT_ATTR, api_client)
+                logger.info(f"LangflowApiClient created successfully for session {session_id} using credentials from {creds_source}.")
+                return api_client
+            except ValidationError as e:
+                raise LangflowAuthException(f"Invalid Langflow credentials structure: {e}")
+            except (LangflowAuthException, LangflowApiException) as e:
+                logger.error(f"Failed to create LangflowApiClient for session {session_id}: {e}")
+                raise
+    finally:
+        # Whatever the outcome, drop the lock: successes hit the session attribute fast path from now on,
+        # and failures must not leave an entry behind. Only remove it if a newer lock has not replaced it.
+        if _client_creation_locks.get(session_id) is creation_lock:
+            del _client_creation_locks[session_id]
 
 @asynccontextmanager
 async def app_lifespan(app: FastMCP) -> AsyncIterator[None]:
+    global _shared_httpx_client, _active_lifespans
     logger.info("LangflowMCP Server application starting...")
-    yield
-    logger.info("LangflowMCP Server application shutting down...")
-    clients_to_close = list(active_langflow_api_clients.values())
-    active_langflow_api_clients.clear()
-    _client_creation_locks.clear()
-    async with anyio.create_task_group() as tg:
-        for client in clients_to_close:
-            tg.start_soon(client.close)
-    logger.info("Global lifespan cleanup finished.")
+    _active_lifespans += 1
+    _get_shared_httpx_client()
+    try:
+        yield
+    finally:
+        logger.info("LangflowMCP Server application shutting down...")
+        _active_lifespans -= 1
+        if _active_lifespans == 0:
+            _client_creation_locks.clear()
+            # Detach before awaiting aclose: a lifespan that starts meanwhile must get a fresh client.
+            closing_client, _shared_httpx_client = _shared_httpx_client, None
+            if closing_client is not None:
+                await closing_client.aclose()
+            logger.info("Global lifespan cleanup finished.")
 
 # --- FastMCP Application ---
+def _serialize_tool_result(data: Any) -> str:
+    """Serializes tool results to compact JSON in pydantic-core (FastMCP's default pretty-prints)."""
+    return pydantic_core.to_json(data, fallback=str).decode()
+
 mcp_app = FastMCP(
     name="LangflowMCP Server",
     instructions="This server exposes tools to interact with the Langflow API, allowing for programmatic management and execution of flows.",
     dependencies=["httpx", "pydantic"],
     lifespan=app_lifespan,
+    tool_serializer=_serialize_tool_result,
 )
 
 def register_tools() -> None:
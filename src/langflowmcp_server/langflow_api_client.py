@@ -1,62 +1,109 @@
 import httpx
 import logging
-from typing import Any, Dict, Optional, Type, TypeVar, AsyncIterator, List
+import orjson
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, AsyncIterator, List, Union
 
-from pydantic import BaseModel, ValidationError
-from .langflow_models import LangflowApiException, LangflowAuthException, GenericSuccessMessage
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from .langflow_models import LangflowApiException, LangflowAuthException, GenericSuccessMessage, StreamEvent
 
 logger = logging.getLogger(__name__)
 ResponseType = TypeVar("ResponseType", bound=BaseModel)
+# Request bodies are either a pydantic model or JSON bytes the caller has already serialized.
+RequestBody = Union[BaseModel, bytes]
+
+# --- API Paths ---
+# Item paths are built by plain concatenation onto these prefixes, e.g. _FLOWS_PATH + flow_id.
+_VERSION_PATH = "/api/v1/version"
+_CONFIG_PATH = "/api/v1/config"
+_ALL_COMPONENTS_PATH = "/api/v1/all"
+_PROJECTS_PATH = "/api/v1/projects/"
+_FLOWS_PATH = "/api/v1/flows/"
+_RUN_PATH = "/api/v1/run/"
+
+@lru_cache(maxsize=None)
+def _response_adapter(response_model: Type[BaseModel]) -> TypeAdapter:
+    """Returns a TypeAdapter for a response model, built once per model and reused."""
+    return TypeAdapter(response_model)
+
+def _status_exception(e: httpx.HTTPStatusError) -> Exception:
+    """Maps an HTTP error response to the matching Langflow exception."""
+    if e.response.status_code == 401:
+        return LangflowAuthException("Authentication failed. The provided API key is invalid.")
+    return LangflowApiException(e.response.status_code, e.response.text)
+
+# Connection pool limits for the process-wide transport shared by all sessions.
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=1000)
+# Streamed runs can sit silently between events for as long as a component takes, so only
+# connecting and sending are bounded; the read side waits for Langflow to emit or close.
+STREAM_TIMEOUT = httpx.Timeout(30.0, read=None)
+
+def create_shared_httpx_client() -> httpx.AsyncClient:
+    """Creates the pooled httpx client shared by every LangflowApiClient in the process."""
+    return httpx.AsyncClient(
+        headers={"accept": "application/json"},
+        timeout=30.0,
+        limits=HTTP_POOL_LIMITS,
+    )
 
 class LangflowApiClient:
     """An asynchronous client for the Langflow REST API."""
 
-    def __init__(self, base_url: str, httpx_client: httpx.AsyncClient):
+    def __init__(self, base_url: str, get_httpx_client: Callable[[], httpx.AsyncClient], api_key: str):
         self._base_url = base_url.rstrip('/')
-        self._httpx_client = httpx_client
+        # The shared transport is resolved on every request so a recreated pool is picked up
+        # instead of holding on to one that has since been closed.
+        self._get_httpx_client = get_httpx_client
+        # Per-session auth headers, built once and sent with every request over the shared transport.
+        self._headers = {"x-api-key": api_key}
+        self._json_headers = {**self._headers, "content-type": "application/json"}
 
     @classmethod
-    async def create(cls, base_url: str, api_key: str) -> "LangflowApiClient":
+    async def create(
+        cls, base_url: str, api_key: str, get_httpx_client: Callable[[], httpx.AsyncClient]
+    ) -> "LangflowApiClient":
+        """Creates a client for one set of credentials on top of a shared httpx transport.
+
+        No request is made here; connection and authentication errors surface on first use.
+        Call `get_version()` explicitly if eager validation is needed.
+        """
         if not api_key:
             raise LangflowAuthException("API key must be provided.")
-        
-        headers = {
-            "accept": "application/json",
-            "x-api-key": api_key,
-        }
-        httpx_client = httpx.AsyncClient(headers=headers, timeout=30.0)
-        
-        try:
-            await httpx_client.get(f"{base_url.rstrip('/')}/api/v1/version")
-        except httpx.RequestError as e:
-            raise LangflowApiException(0, f"Failed to connect to Langflow at {base_url}: {e}") from e
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise LangflowAuthException("Authentication failed. The provided API key is invalid.") from e
-            raise LangflowApiException(e.response.status_code, f"Failed to connect to Langflow: {e.response.text}") from e
-
-        return cls(base_url, httpx_client)
+        return cls(base_url, get_httpx_client, api_key)
 
     async def close(self):
-        if not self._httpx_client.is_closed:
-            await self._httpx_client.aclose()
-            logger.debug("Langflow API HTTP client closed.")
+        # The httpx transport is shared across sessions and owned by the app lifespan.
+        logger.debug("Langflow API client released; shared HTTP transport left open.")
 
-    async def _request(self, method: str, path: str, response_model: Optional[Type[ResponseType]] = None, **kwargs):
-        url = f"{self._base_url}{path}"
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        response_model: Optional[Type[ResponseType]] = None,
+        body: Optional[RequestBody] = None,
+        **kwargs,
+    ):
+        url = self._base_url + path
+        headers = self._headers
+        if body is not None:
+            # Models are serialized straight to JSON by pydantic-core, skipping the intermediate dict.
+            if isinstance(body, BaseModel):
+                body = body.model_dump_json(exclude_none=True).encode()
+            kwargs["content"] = body
+            headers = self._json_headers
         try:
-            response = await self._httpx_client.request(method, url, **kwargs)
+            response = await self._get_httpx_client().request(method, url, headers=headers, **kwargs)
             response.raise_for_status()
 
             if response.status_code == 204:
                 return None
             
-            response_json = response.json()
+            response_json = orjson.loads(response.content)
             if response_model:
-                return response_model.model_validate(response_json)
+                return _response_adapter(response_model).validate_python(response_json)
             return response_json
         except httpx.HTTPStatusError as e:
-            raise LangflowApiException(e.response.status_code, e.response.text) from e
+            raise _status_exception(e) from e
         except (ValidationError, ValueError) as e:
             raise LangflowApiException(0, f"Failed to parse API response: {e}") from e
         except httpx.RequestError as e:
@@ -64,19 +111,19 @@ class LangflowApiClient:
 
     # --- Project CRUD Methods ---
     async def list_projects(self) -> List[Dict[str, Any]]:
-        return await self._request("GET", "/api/v1/projects/")
+        return await self._request("GET", _PROJECTS_PATH)
 
-    async def create_project(self, data: BaseModel) -> Dict[str, Any]:
-        return await self._request("POST", "/api/v1/projects/", json=data.model_dump(exclude_none=True))
+    async def create_project(self, data: RequestBody) -> Dict[str, Any]:
+        return await self._request("POST", _PROJECTS_PATH, body=data)
 
     async def get_project(self, project_id: str) -> Dict[str, Any]:
-        return await self._request("GET", f"/api/v1/projects/{project_id}")
+        return await self._request("GET", _PROJECTS_PATH + project_id)
 
-    async def update_project(self, project_id: str, data: BaseModel) -> Dict[str, Any]:
-        return await self._request("PATCH", f"/api/v1/projects/{project_id}", json=data.model_dump(exclude_none=True))
+    async def update_project(self, project_id: str, data: RequestBody) -> Dict[str, Any]:
+        return await self._request("PATCH", _PROJECTS_PATH + project_id, body=data)
 
     async def delete_project(self, project_id: str):
-        await self._request("DELETE", f"/api/v1/projects/{project_id}")
+        await self._request("DELETE", _PROJECTS_PATH + project_id)
 
     # --- Flow CRUD Methods ---
     async def list_flows(
@@ -104,30 +151,55 @@ class LangflowApiClient:
         # Filter out None values to keep the URL clean
         cleaned_params = {k: v for k, v in params.items() if v is not None}
         
-        return await self._request("GET", "/api/v1/flows/", params=cleaned_params)
+        return await self._request("GET", _FLOWS_PATH, params=cleaned_params)
 
-    async def create_flow(self, data: BaseModel) -> Dict[str, Any]:
-        return await self._request("POST", "/api/v1/flows/", json=data.model_dump(exclude_none=True))
+    async def create_flow(self, data: RequestBody) -> Dict[str, Any]:
+        return await self._request("POST", _FLOWS_PATH, body=data)
 
     async def get_flow(self, flow_id: str) -> Dict[str, Any]:
-        return await self._request("GET", f"/api/v1/flows/{flow_id}")
+        return await self._request("GET", _FLOWS_PATH + flow_id)
 
-    async def update_flow(self, flow_id: str, data: BaseModel) -> Dict[str, Any]:
-        return await self._request("PATCH", f"/api/v1/flows/{flow_id}", json=data.model_dump(exclude_none=True))
+    async def update_flow(self, flow_id: str, data: RequestBody) -> Dict[str, Any]:
+        return await self._request("PATCH", _FLOWS_PATH + flow_id, body=data)
 
     async def delete_flow(self, flow_id: str) -> GenericSuccessMessage:
-        return await self._request("DELETE", f"/api/v1/flows/{flow_id}", response_model=GenericSuccessMessage)
+        return await self._request("DELETE", _FLOWS_PATH + flow_id, response_model=GenericSuccessMessage)
 
     # --- Execution Methods ---
-    async def run_flow(self, flow_id: str, data: BaseModel) -> Dict[str, Any]:
-        return await self._request("POST", f"/api/v1/run/{flow_id}", json=data.model_dump(exclude_none=True))
+    async def run_flow(self, flow_id: str, data: RequestBody) -> Dict[str, Any]:
+        return await self._request("POST", _RUN_PATH + flow_id, body=data)
+
+    async def stream_run_flow(self, flow_id: str, data: RequestBody) -> AsyncIterator[StreamEvent]:
+        """Runs a flow with streaming enabled, yielding each event as Langflow emits it."""
+        url = self._base_url + _RUN_PATH + flow_id
+        if isinstance(data, BaseModel):
+            data = data.model_dump_json(exclude_none=True).encode()
+        try:
+            async with self._get_httpx_client().stream(
+                "POST", url, params={"stream": "true"}, content=data, headers=self._json_headers,
+                timeout=STREAM_TIMEOUT,
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+                # Langflow emits one JSON object per event, separated by blank lines.
+                async for line in response.aiter_lines():
+                    if line.strip():
+                        payload = orjson.loads(line)
+                        yield StreamEvent(event=payload.get("event", ""), data=payload.get("data") or {})
+        except httpx.HTTPStatusError as e:
+            raise _status_exception(e) from e
+        except ValueError as e:
+            raise LangflowApiException(0, f"Failed to parse stream event: {e}") from e
+        except httpx.RequestError as e:
+            raise LangflowApiException(0, f"HTTP request failed: {e}") from e
 
     # --- Utility Methods ---
     async def get_all_components(self) -> Dict[str, Any]:
-        return await self._request("GET", "/api/v1/all")
+        return await self._request("GET", _ALL_COMPONENTS_PATH)
         
     async def get_version(self) -> Dict[str, Any]:
-        return await self._request("GET", "/api/v1/version")
+        return await self._request("GET", _VERSION_PATH)
 
     async def get_config(self) -> Dict[str, Any]:
-        return await self._request("GET", "/api/v1/config")
\ No newline at end of file
+        return await self._request("GET", _CONFIG_PATH)
\ No newline at end of file
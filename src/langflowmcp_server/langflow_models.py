@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Union
 from enum import Enum
 
@@ -9,19 +10,26 @@ class AccessTypeEnum(str, Enum):
 
 
 # --- Custom Exceptions ---
-class LangflowAuthException(Exception): pass
 class LangflowApiException(Exception):
     def __init__(self, status_code: int, message: str):
         super().__init__(message)
         self.status_code = status_code
         self.message = message
+        self._str = f"Langflow API Error {status_code}: {message}"
     def __str__(self):
-        return f"Langflow API Error {self.status_code}: {self.message}"
+        return self._str
+
+class LangflowAuthException(LangflowApiException):
+    """Authentication failure; a LangflowApiException with status 401 so tool handlers report it."""
+    def __init__(self, message: str):
+        super().__init__(401, message)
 
 # --- Client Credentials ---
 class LangflowClientCreds(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
     api_key: str = Field(..., description="API Key for Langflow authentication.")
-    url: Optional[HttpUrl] = Field(None, description="Optional Langflow Base URL override.")
+    url: Optional[str] = Field(None, description="Optional Langflow Base URL override.")
 
 # --- Flow Execution Models ---
 class RunFlowRequest(BaseModel):
@@ -36,16 +44,21 @@ class RunFlowResponse(BaseModel):
     session_id: str
     outputs: List[Dict[str, Any]]
 
-class StreamEvent(BaseModel):
+# Created once per streamed event and never exposed as a tool schema, so a slotted dataclass
+# avoids BaseModel construction overhead on the streaming hot path.
+@dataclass(slots=True)
+class StreamEvent:
     event: str
     data: Dict[str, Any]
 
 # --- Project Models ---
 class ProjectModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     id: str
     name: str
     description: Optional[str] = None
-    parent_id: Optional[str] = Field(None, alias="parent_id")
+    parent_id: Optional[str] = None
 
 class CreateProjectRequest(BaseModel):
     name: str
@@ -59,11 +72,15 @@ class UpdateProjectRequest(BaseModel):
 
 # --- Flow Data Structure Models ---
 class FlowNodeData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     data: Dict[str, Any]
     id: str
     type: str
 
 class FlowEdge(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     source: str
     target: str
     sourceHandle: str
@@ -71,18 +88,22 @@ class FlowEdge(BaseModel):
     id: str
 
 class FlowData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     nodes: List[FlowNodeData]
     edges: List[FlowEdge]
     viewport: Dict[str, Any]
 
 # --- Flow Models ---
 class FlowModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     id: str
     name: str
     description: Optional[str] = None
     data: Optional[FlowData] = None
     is_component: bool = False
-    updated_at: str
+    updated_at: Optional[str] = None  # Absent from header-only listings (header_flows=True)
     webhook: bool = False
     endpoint_name: Optional[str] = None
     locked: bool = False
@@ -111,10 +132,6 @@ class UpdateFlowRequest(BaseModel):
     data: Optional[FlowData] = None
     folder_id: Optional[str] = None # Renamed for consistency
 
-class AllFlowsResponse(BaseModel):
-    count: int
-    flows: List[FlowModel]
-
 class FlowsListResponse(BaseModel):
     """A structured response for listing flows, including pagination details."""
     total_count: int = Field(description="The total number of flows matching the criteria.")
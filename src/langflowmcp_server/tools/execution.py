@@ -1,4 +1,5 @@
 import logging
+from contextlib import aclosing
 from typing import Any, Dict, Optional, List
 
 from fastmcp import FastMCP, Context
@@ -19,7 +20,7 @@ class RunFlowPayload(BaseModel):
 
 async def run_langflow_flow_impl(ctx: Context, payload: RunFlowPayload) -> RunFlowResponse:
     """Executes a Langflow flow synchronously and returns the final result."""
-    logger.info(f"Tool 'run_langflow_flow' called for flow_id: {payload.flow_id}")
+    logger.info("Tool 'run_langflow_flow' called for flow_id: %s", payload.flow_id)
     try:
         client = await get_session_langflow_client(ctx)
         request_data = RunFlowRequest(
@@ -36,6 +37,38 @@ async def run_langflow_flow_impl(ctx: Context, payload: RunFlowPayload) -> RunFl
         logger.exception("Unexpected error in run_langflow_flow_impl")
         raise ToolError(f"An unexpected error occurred: {e}")
 
+async def run_langflow_flow_stream_impl(ctx: Context, payload: RunFlowPayload) -> RunFlowResponse:
+    """Executes a Langflow flow in streaming mode, reporting progress as events arrive, and returns the final result."""
+    logger.info("Tool 'run_langflow_flow_stream' called for flow_id: %s", payload.flow_id)
+    try:
+        client = await get_session_langflow_client(ctx)
+        request_data = RunFlowRequest(
+            input_value=payload.input_value,
+            session_id=payload.session_id,
+            output_type=payload.output_type,
+            tweaks=payload.tweaks,
+        )
+        events_seen = 0
+        # aclosing releases the streamed response and its pooled connection as soon as we return or raise.
+        async with aclosing(client.stream_run_flow(payload.flow_id, request_data)) as events:
+            async for event in events:
+                if event.event == "end":
+                    return RunFlowResponse.model_validate(event.data.get("result", {}))
+                if event.event == "error":
+                    raise ToolError(f"Flow run failed: {event.data.get('error', event.data)}")
+                # Progress notifications keep the client's request timeout alive during long runs.
+                events_seen += 1
+                await ctx.report_progress(progress=events_seen, message=event.event)
+        raise ToolError("Flow stream ended without a result.")
+    except ToolError:
+        raise
+    except LangflowApiException as e:
+        raise ToolError(f"Failed to run flow: {e.message}")
+    except Exception as e:
+        logger.exception("Unexpected error in run_langflow_flow_stream_impl")
+        raise ToolError(f"An unexpected error occurred: {e}")
+
 def register_execution_tools(app: FastMCP):
     logger.info("Registering Execution tools...")
-    app.tool(name="run_langflow_flow")(run_langflow_flow_impl)
\ No newline at end of file
+    app.tool(name="run_langflow_flow")(run_langflow_flow_impl)
+    app.tool(name="run_langflow_flow_stream")(run_langflow_flow_stream_impl)
\ No newline at end of file
@@ -2,13 +2,37 @@ import logging
 from typing import Optional, List, Dict, Any
 from fastmcp import FastMCP, Context
 from fastmcp.exceptions import ToolError
-from pydantic import Field, ValidationError
+from pydantic import Field
 
-from ..langflow_models import LangflowApiException, FlowModel, CreateFlowRequest, UpdateFlowRequest, AllFlowsResponse, GenericSuccessMessage, FlowsListResponse
+from ..langflow_models import LangflowApiException, FlowModel, FlowData, FlowNodeData, FlowEdge, CreateFlowRequest, UpdateFlowRequest, GenericSuccessMessage, FlowsListResponse
 from ..app import get_session_langflow_client
 
 logger = logging.getLogger(__name__)
 
+def _fast_flow(flow: Dict[str, Any]) -> FlowModel:
+    """Builds a FlowModel from a Langflow API payload with model_construct, skipping validation.
+
+    Only safe for data returned by Langflow itself; tool inputs are still validated.
+    Raises TypeError if the payload is not shaped like a flow.
+    """
+    if not isinstance(flow, dict):
+        raise TypeError(f"expected a flow object, got {type(flow).__name__}")
+    data = flow.get("data")
+    if isinstance(data, dict):
+        flow = {
+            **flow,
+            "data": FlowData.model_construct(
+                nodes=[FlowNodeData.model_construct(**node) for node in data.get("nodes") or []],
+                edges=[FlowEdge.model_construct(**edge) for edge in data.get("edges") or []],
+                viewport=data.get("viewport") or {},
+            ),
+        }
+    return FlowModel.model_construct(**flow)
+
+def _malformed_flow_error(e: TypeError) -> ToolError:
+    logger.error("Malformed flow data from Langflow API: %s", e)
+    return ToolError(f"Data from Langflow API for flows is malformed: {e}")
+
 async def list_langflow_flows_impl(
     ctx: Context,
     remove_example_flows: bool = Field(True, description="If True, example flows are excluded from the results."),
@@ -20,7 +44,7 @@ async def list_langflow_flows_impl(
     size: int = Field(50, description="The number of items per page when pagination is active (get_all=False).")
 ) -> FlowsListResponse:
     """Lists available flows in LangFlow, with optional filtering and pagination."""
-    logger.info(f"Tool 'list_langflow_flows' called with params: folder_id={folder_id}, get_all={get_all}")
+    logger.info("Tool 'list_langflow_flows' called with params: folder_id=%s, get_all=%s", folder_id, get_all)
     try:
         client = await get_session_langflow_client(ctx)
         response_data = await client.list_flows(
@@ -35,65 +59,70 @@ async def list_langflow_flows_impl(
 
         if isinstance(response_data, list):
             # API returned a direct list (get_all=True or header_flows=True)
-            return FlowsListResponse(
+            return FlowsListResponse.model_construct(
                 total_count=len(response_data),
-                flows=response_data
+                flows=[_fast_flow(f) for f in response_data]
             )
         elif isinstance(response_data, dict) and "items" in response_data:
             # API returned a paginated response object
-            return FlowsListResponse(
+            return FlowsListResponse.model_construct(
                 total_count=response_data.get("total", 0),
-                flows=response_data.get("items", []),
+                flows=[_fast_flow(f) for f in response_data.get("items", [])],
                 page=response_data.get("page"),
                 size=response_data.get("size"),
                 pages=response_data.get("pages"),
             )
         else:
-            logger.warning(f"Unexpected response format from list_flows: {type(response_data)}")
-            return FlowsListResponse(total_count=0, flows=[])
+            logger.warning("Unexpected response format from list_flows: %s", type(response_data))
+            return FlowsListResponse.model_construct(total_count=0, flows=[])
 
     except LangflowApiException as e:
         raise ToolError(f"Failed to list flows: {e.message}")
-    except ValidationError as e:
-        logger.error(f"Pydantic validation failed for flows list: {e}")
-        raise ToolError(f"Data from Langflow API for flows is malformed: {e}")
+    except TypeError as e:
+        raise _malformed_flow_error(e)
 
 async def create_langflow_flow_impl(ctx: Context, name: str, description: Optional[str] = None, project_id: Optional[str] = None) -> FlowModel:
     """Creates a new, empty flow in Langflow, optionally assigning it to a project."""
-    logger.info(f"Tool 'create_langflow_flow' called with name: {name}")
+    logger.info("Tool 'create_langflow_flow' called with name: %s", name)
     try:
         client = await get_session_langflow_client(ctx)
         request_data = CreateFlowRequest(name=name, description=description, project_id=project_id)
         response = await client.create_flow(request_data)
-        return FlowModel.model_validate(response)
+        return _fast_flow(response)
     except LangflowApiException as e:
         raise ToolError(f"Failed to create flow: {e.message}")
+    except TypeError as e:
+        raise _malformed_flow_error(e)
 
 async def get_langflow_flow_details_impl(ctx: Context, flow_id: str = Field(..., description="The ID of the flow to retrieve.")) -> Optional[FlowModel]:
     """Retrieves the details of a specific Langflow flow by its ID."""
-    logger.info(f"Tool 'get_langflow_flow_details' called for flow_id: {flow_id}")
+    logger.info("Tool 'get_langflow_flow_details' called for flow_id: %s", flow_id)
     try:
         client = await get_session_langflow_client(ctx)
         response = await client.get_flow(flow_id)
-        return FlowModel.model_validate(response)
+        return _fast_flow(response)
     except LangflowApiException as e:
         if e.status_code == 404: return None
         raise ToolError(f"Failed to get flow details: {e.message}")
+    except TypeError as e:
+        raise _malformed_flow_error(e)
 
 async def update_langflow_flow_impl(ctx: Context, flow_id: str, name: Optional[str] = None, description: Optional[str] = None, data: Optional[Dict[str, Any]] = None) -> FlowModel:
     """Updates an existing flow in Langflow."""
-    logger.info(f"Tool 'update_langflow_flow' called for flow_id: {flow_id}")
+    logger.info("Tool 'update_langflow_flow' called for flow_id: %s", flow_id)
     try:
         client = await get_session_langflow_client(ctx)
         request_data = UpdateFlowRequest(name=name, description=description, data=data)
         response = await client.update_flow(flow_id, request_data)
-        return FlowModel.model_validate(response)
+        return _fast_flow(response)
     except LangflowApiException as e:
         raise ToolError(f"Failed to update flow: {e.message}")
+    except TypeError as e:
+        raise _malformed_flow_error(e)
 
 async def delete_langflow_flow_impl(ctx: Context, flow_id: str = Field(..., description="The ID of the flow to delete.")) -> GenericSuccessMessage:
     """Deletes a flow from Langflow."""
-    logger.info(f"Tool 'delete_langflow_flow' called for flow_id: {flow_id}")
+    logger.info("Tool 'delete_langflow_flow' called for flow_id: %s", flow_id)
     try:
         client = await get_session_langflow_client(ctx)
         return await client.delete_flow(flow_id)
@@ -16,13 +16,15 @@ async def list_langflow_projects_impl(ctx: Context) -> List[ProjectModel]:
     try:
         client = await get_session_langflow_client(ctx)
         response = await client.list_projects()
-        return [ProjectModel.model_validate(p) for p in response]
+        # model_construct skips validation; only safe because the data comes from Langflow's own API.
+        construct_project = ProjectModel.model_construct
+        return [construct_project(**p) for p in response]
     except LangflowApiException as e:
         raise ToolError(f"Failed to list projects: {e.message}")
 
 async def create_langflow_project_impl(ctx: Context, name: str, description: Optional[str] = None) -> ProjectModel:
     """Creates a new project in Langflow."""
-    logger.info(f"Tool 'create_langflow_project' called with name: {name}")
+    logger.info("Tool 'create_langflow_project' called with name: %s", name)
     try:
         client = await get_session_langflow_client(ctx)
         request_data = CreateProjectRequest(name=name, description=description)
@@ -33,7 +35,7 @@ async def create_langflow_project_impl(ctx: Context, name: str, description: Opt
 
 async def update_langflow_project_impl(ctx: Context, project_id: str, name: Optional[str] = None, description: Optional[str] = None) -> ProjectModel:
     """Updates an existing project in Langflow."""
-    logger.info(f"Tool 'update_langflow_project' called for project_id: {project_id}")
+    logger.info("Tool 'update_langflow_project' called for project_id: %s", project_id)
     try:
         client = await get_session_langflow_client(ctx)
         request_data = UpdateProjectRequest(name=name, description=description)
@@ -44,7 +46,7 @@ async def update_langflow_project_impl(ctx: Context, project_id: str, name: Opti
 
 async def delete_langflow_project_impl(ctx: Context, project_id: str = Field(..., description="The ID of the project to delete.")):
     """Deletes a project from Langflow."""
-    logger.info(f"Tool 'delete_langflow_project' called for project_id: {project_id}")
+    logger.info("Tool 'delete_langflow_project' called for project_id: %s", project_id)
     try:
         client = await get_session_langflow_client(ctx)
         await client.delete_project(project_id)
@@ -0,0 +1,29 @@
+import httpx
+import pytest
+
+from langflowmcp_server.langflow_api_client import LangflowApiClient
+
+
+@pytest.fixture
+def make_client():
+    """Returns a factory building a LangflowApiClient backed by an httpx MockTransport handler."""
+    def factory(handler) -> LangflowApiClient:
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return LangflowApiClient("http://langflow.test/", lambda: http, "test-key")
+
+    return factory
+
+
+@pytest.fixture
+def use_client(monkeypatch, make_client):
+    """Makes a tool module's get_session_langflow_client return a mock-backed client."""
+    def install(tool_module, handler) -> LangflowApiClient:
+        client = make_client(handler)
+
+        async def get_client(ctx):
+            return client
+
+        monkeypatch.setattr(tool_module, "get_session_langflow_client", get_client)
+        return client
+
+    return install
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from langflowmcp_server import app
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_lifespan_started_during_teardown_keeps_an_open_client(monkeypatch):
+    closing = asyncio.Event()
+    release = asyncio.Event()
+    first_client = app._get_shared_httpx_client()
+    original_aclose = first_client.aclose
+
+    async def slow_aclose():
+        closing.set()
+        await release.wait()
+        await original_aclose()
+
+    monkeypatch.setattr(first_client, "aclose", slow_aclose)
+
+    first = app.app_lifespan(app.mcp_app)
+    await first.__aenter__()
+    teardown = asyncio.create_task(first.__aexit__(None, None, None))
+    await closing.wait()
+
+    # A new connection arrives while the last lifespan is still closing the shared client.
+    second = app.app_lifespan(app.mcp_app)
+    await second.__aenter__()
+    release.set()
+    await teardown
+
+    assert first_client.is_closed
+    assert app._shared_httpx_client is not None
+    assert app._shared_httpx_client is not first_client
+    assert not app._shared_httpx_client.is_closed
+
+    await second.__aexit__(None, None, None)
+    assert app._shared_httpx_client is None
+    assert app._active_lifespans == 0
@@ -0,0 +1,51 @@
+import httpx
+import pytest
+from fastmcp.exceptions import ToolError
+
+from langflowmcp_server.langflow_models import FlowData
+from langflowmcp_server.tools import flows
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_header_only_listing_leaves_updated_at_unset(use_client):
+    headers = [{"id": "f1", "name": "Flow", "folder_id": "p1", "is_component": False}]
+    use_client(flows, lambda request: httpx.Response(200, json=headers))
+
+    result = await flows.list_langflow_flows_impl(
+        None, remove_example_flows=True, components_only=False, get_all=True,
+        folder_id=None, header_flows=True, page=1, size=50,
+    )
+
+    assert result.total_count == 1
+    flow = result.flows[0]
+    assert flow.id == "f1"
+    assert flow.updated_at is None
+    assert flow.data is None
+    assert '"updated_at":null' in result.model_dump_json()
+
+
+async def test_null_node_and_edge_lists_become_empty(use_client):
+    listing = [{"id": "f1", "name": "Flow", "data": {"nodes": None, "edges": None, "viewport": None}},
+               {"id": "f2", "name": "Empty", "data": {}}]
+    use_client(flows, lambda request: httpx.Response(200, json=listing))
+
+    result = await flows.list_langflow_flows_impl(
+        None, remove_example_flows=True, components_only=False, get_all=True,
+        folder_id=None, header_flows=False, page=1, size=50,
+    )
+
+    for flow in result.flows:
+        assert isinstance(flow.data, FlowData)
+        assert flow.data.nodes == [] and flow.data.edges == [] and flow.data.viewport == {}
+
+
+@pytest.mark.parametrize("listing", [["not-a-flow"], [{"id": "f1", "name": "Flow", "data": {"nodes": ["bad"]}}]])
+async def test_malformed_flows_raise_tool_error(use_client, listing):
+    use_client(flows, lambda request: httpx.Response(200, json=listing))
+
+    with pytest.raises(ToolError, match="malformed"):
+        await flows.list_langflow_flows_impl(
+            None, remove_example_flows=True, components_only=False, get_all=True,
+            folder_id=None, header_flows=False, page=1, size=50,
+        )
@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+import pytest
+
+from langflowmcp_server import app
+from langflowmcp_server.langflow_models import LangflowApiException, LangflowAuthException
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeSession:
+    def __init__(self, credentials):
+        self._client_params = SimpleNamespace(_meta={"langflow_credentials": credentials})
+
+
+def context(credentials) -> SimpleNamespace:
+    return SimpleNamespace(session=FakeSession(credentials))
+
+
+async def test_meta_url_scheme_is_case_insensitive(monkeypatch):
+    monkeypatch.delenv("LANGFLOW_BASE_URL", raising=False)
+
+    client = await app.get_session_langflow_client(context({"api_key": "k", "url": "HTTPS://Langflow.test/"}))
+
+    assert client._base_url == "HTTPS://Langflow.test"
+
+
+async def test_non_string_meta_url_is_rejected_as_invalid_credentials():
+    with pytest.raises(LangflowAuthException, match="Invalid Langflow credentials"):
+        await app.get_session_langflow_client(context({"api_key": "k", "url": 123}))
+
+
+@pytest.mark.parametrize("url", ["ftp://langflow.test", "langflow.test", "::::"])
+async def test_non_http_meta_url_is_rejected(url):
+    with pytest.raises(LangflowApiException, match="expected an http\\(s\\) URL"):
+        await app.get_session_langflow_client(context({"api_key": "k", "url": url}))
+
+
+@pytest.mark.parametrize("credentials", [{}, {"url": "http://langflow.test"}, {"api_key": "k", "url": "ftp://x"}])
+async def test_failed_creation_releases_the_session_lock(monkeypatch, credentials):
+    monkeypatch.delenv("LANGFLOW_BASE_URL", raising=False)
+    ctx = context(credentials)
+
+    with pytest.raises(LangflowApiException):
+        await app.get_session_langflow_client(ctx)
+
+    assert id(ctx.session) not in app._client_creation_locks
+
+
+async def test_successful_creation_releases_the_session_lock():
+    ctx = context({"api_key": "k", "url": "http://langflow.test"})
+
+    client = await app.get_session_langflow_client(ctx)
+
+    assert id(ctx.session) not in app._client_creation_locks
+    assert await app.get_session_langflow_client(ctx) is client
@@ -0,0 +1,103 @@
+import httpx
+import pytest
+from fastmcp.exceptions import ToolError
+
+from langflowmcp_server.langflow_models import LangflowApiException, LangflowAuthException, RunFlowRequest
+from langflowmcp_server.tools import execution
+
+pytestmark = pytest.mark.asyncio
+
+END_EVENT = b'{"event": "end", "data": {"result": {"session_id": "s1", "outputs": [{"text": "hi"}]}}}\n\n'
+
+
+class TrackedStream(httpx.AsyncByteStream):
+    """Response body that records whether the streamed response was closed."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.progress = []
+
+    async def report_progress(self, progress, total=None, message=None):
+        self.progress.append((progress, message))
+
+
+def payload() -> execution.RunFlowPayload:
+    return execution.RunFlowPayload(flow_id="flow-1", input_value="hello")
+
+
+async def test_stream_returns_result_from_end_event(use_client):
+    requests = []
+    body = TrackedStream([b'{"event": "token", "data": {"chunk": "h"}}\n\n', END_EVENT])
+
+    def handler(request: httpx.Request):
+        requests.append(request)
+        return httpx.Response(200, stream=body)
+
+    use_client(execution, handler)
+    ctx = FakeContext()
+
+    result = await execution.run_langflow_flow_stream_impl(ctx, payload())
+
+    assert result.session_id == "s1"
+    assert result.outputs == [{"text": "hi"}]
+    assert ctx.progress == [(1, "token")]
+    assert requests[0].url.path == "/api/v1/run/flow-1"
+    assert requests[0].url.params["stream"] == "true"
+    assert requests[0].headers["x-api-key"] == "test-key"
+    assert requests[0].headers["content-type"] == "application/json"
+    # Long gaps between events must not trip the shared client's 30 s read timeout.
+    assert requests[0].extensions["timeout"]["read"] is None
+    # The response is released as soon as the tool returns, not left to the asyncgen finalizer.
+    assert body.closed
+
+
+async def test_stream_error_event_raises_tool_error(use_client):
+    body = TrackedStream([b'{"event": "error", "data": {"error": "boom"}}\n\n', END_EVENT])
+    use_client(execution, lambda request: httpx.Response(200, stream=body))
+
+    with pytest.raises(ToolError, match="Flow run failed: boom"):
+        await execution.run_langflow_flow_stream_impl(FakeContext(), payload())
+    assert body.closed
+
+
+async def test_stream_without_end_event_raises_tool_error(use_client):
+    use_client(execution, lambda request: httpx.Response(200, content=b'{"event": "token", "data": {}}\n\n'))
+
+    with pytest.raises(ToolError, match="ended without a result"):
+        await execution.run_langflow_flow_stream_impl(FakeContext(), payload())
+
+
+async def test_stream_http_error_is_reported_as_tool_error(use_client):
+    use_client(execution, lambda request: httpx.Response(500, text="server exploded"))
+
+    with pytest.raises(ToolError, match="Failed to run flow: server exploded"):
+        await execution.run_langflow_flow_stream_impl(FakeContext(), payload())
+
+
+async def test_stream_run_flow_maps_http_errors(make_client):
+    request = RunFlowRequest(input_value="hello")
+
+    client = make_client(lambda r: httpx.Response(401, text="unauthorized"))
+    with pytest.raises(LangflowAuthException) as auth_error:
+        async for _ in client.stream_run_flow("flow-1", request):
+            pass
+    assert auth_error.value.status_code == 401
+
+    client = make_client(lambda r: httpx.Response(404, text="flow not found"))
+    with pytest.raises(LangflowApiException) as api_error:
+        async for _ in client.stream_run_flow("flow-1", request):
+            pass
+    assert api_error.value.status_code == 404
+    assert api_error.value.message == "flow not found"